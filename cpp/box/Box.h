@@ -117,6 +117,24 @@ public:
         m_lo = -m_hi;
     }
 
+    //! Set Lx, keeping the other box lengths fixed
+    void setLx(const float Lx)
+    {
+        setL(Lx, m_L.y, m_L.z);
+    }
+
+    //! Set Ly, keeping the other box lengths fixed
+    void setLy(const float Ly)
+    {
+        setL(m_L.x, Ly, m_L.z);
+    }
+
+    //! Set Lz, keeping the other box lengths fixed
+    void setLz(const float Lz)
+    {
+        setL(m_L.x, m_L.y, Lz);
+    }
+
     //! Set whether box is 2D
     void set2D(bool _2d)
     {
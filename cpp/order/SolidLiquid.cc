@@ -1,6 +1,8 @@
 // Copyright (c) 2010-2023 The Regents of the University of Michigan
 // This file is from the freud project, released under the BSD 3-Clause License.
 
+#include <algorithm>
+#include <memory>
 #include <stdexcept>
 
 #include "NeighborComputeFunctional.h"
@@ -38,21 +40,30 @@ void SolidLiquid::compute(const freud::locality::NeighborList* nlist,
     const unsigned int num_bonds(m_nlist.getNumBonds());
     m_ql_ij.prepare(num_bonds);
 
+    // Each bond is written by exactly one thread, so the solid-like bond
+    // filter is filled in the same parallel loop. A plain bool array is used
+    // because concurrent writes to a std::vector<bool> are not thread safe.
+    auto solid_filter = std::make_unique<bool[]>(num_bonds);
+
     util::forLoopWrapper(
         0, num_query_points,
         [&](size_t begin, size_t end) {
             for (unsigned int i = begin; i != end; ++i)
             {
+                // The qlm values of each point are stored contiguously, so
+                // compute the start of each row once and iterate linearly.
+                const size_t qlm_i_start = static_cast<size_t>(i) * m_num_ms;
                 unsigned int bond(m_nlist.find_first_index(i));
                 for (; bond < num_bonds && m_nlist.getNeighbors()(bond, 0) == i; ++bond)
                 {
                     const unsigned int j(m_nlist.getNeighbors()(bond, 1));
+                    const size_t qlm_j_start = static_cast<size_t>(j) * m_num_ms;
 
                     // Accumulate the dot product over m of qlmi and qlmj vectors
                     std::complex<float> bond_ql_ij = 0;
                     for (unsigned int k = 0; k < m_num_ms; k++)
                     {
-                        bond_ql_ij += qlm(i, k) * std::conj(qlm(j, k));
+                        bond_ql_ij += qlm[qlm_i_start + k] * std::conj(qlm[qlm_j_start + k]);
                     }
 
                     // Optionally normalize dot products by points' ql values,
@@ -62,40 +73,36 @@ void SolidLiquid::compute(const freud::locality::NeighborList* nlist,
                         bond_ql_ij *= normalizationfactor / (ql[i] * ql[j]);
                     }
                     m_ql_ij[bond] = bond_ql_ij.real();
+                    solid_filter[bond] = (m_ql_ij[bond] > m_q_threshold);
                 }
             }
         },
         true);
 
     // Filter neighbors to contain only solid-like bonds
-    std::vector<bool> solid_filter(num_bonds);
-    for (unsigned int bond(0); bond < num_bonds; bond++)
-    {
-        solid_filter[bond] = (m_ql_ij[bond] > m_q_threshold);
-    }
     freud::locality::NeighborList solid_nlist(m_nlist);
-    solid_nlist.filter(solid_filter.cbegin());
+    solid_nlist.filter(solid_filter.get());
 
     // Save the neighbor counts of solid-like bonds for each query point
     m_number_of_connections.prepare(num_query_points);
-    for (unsigned int i(0); i < num_query_points; i++)
-    {
-        m_number_of_connections[i] = solid_nlist.getCounts()[i];
-    }
+    const auto& solid_counts = solid_nlist.getCounts();
+    std::copy(solid_counts.get(), solid_counts.get() + num_query_points, m_number_of_connections.get());
 
     // Filter nlist to only bonds between solid-like particles
     // (particles with more than solid_threshold solid-like bonds)
     const unsigned int num_solid_bonds(solid_nlist.getNumBonds());
-    std::vector<bool> neighbor_count_filter(num_solid_bonds);
-    for (unsigned int bond(0); bond < num_solid_bonds; bond++)
-    {
-        const unsigned int i(solid_nlist.getNeighbors()(bond, 0));
-        const unsigned int j(solid_nlist.getNeighbors()(bond, 1));
-        neighbor_count_filter[bond] = (m_number_of_connections[i] >= m_solid_threshold
-                                       && m_number_of_connections[j] >= m_solid_threshold);
-    }
+    auto neighbor_count_filter = std::make_unique<bool[]>(num_solid_bonds);
+    util::forLoopWrapper(0, num_solid_bonds, [&](size_t begin, size_t end) {
+        for (size_t bond = begin; bond < end; ++bond)
+        {
+            const unsigned int i(solid_nlist.getNeighbors()(bond, 0));
+            const unsigned int j(solid_nlist.getNeighbors()(bond, 1));
+            neighbor_count_filter[bond] = (m_number_of_connections[i] >= m_solid_threshold
+                                           && m_number_of_connections[j] >= m_solid_threshold);
+        }
+    });
     freud::locality::NeighborList solid_neighbor_nlist(solid_nlist);
-    solid_neighbor_nlist.filter(neighbor_count_filter.cbegin());
+    solid_neighbor_nlist.filter(neighbor_count_filter.get());
 
     // Find clusters of solid-like particles
     m_cluster.compute(points, &solid_neighbor_nlist, qargs);
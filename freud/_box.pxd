@@ -19,6 +19,9 @@ cdef extern from "Box.h" namespace "freud::box":
 
         void setL(vec3[float])
         void setL(float, float, float)
+        void setLx(float)
+        void setLy(float)
+        void setLz(float)
 
         void set2D(bool)
         bool is2D() const
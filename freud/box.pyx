@@ -9,17 +9,21 @@ wrapping vectors outside the box back into it.
 
 from cpython.object cimport Py_EQ, Py_NE
 from cython.operator cimport dereference
+from libc.math cimport sqrt
 from libcpp cimport bool as cpp_bool
 
 from freud.util cimport vec3
 
 import logging
 import warnings
+from collections.abc import Mapping
+from functools import singledispatch
 
 import numpy as np
 
 import freud.util
 
+cimport cython
 cimport numpy as np
 
 cimport freud._box
@@ -30,6 +34,59 @@ logger = logging.getLogger(__name__)
 # _always_ do that, or you will have segfaults
 np.import_array()
 
+_Z_IN_2D_BOX_MESSAGE = (
+    "Specifying z-dimensions in a 2-dimensional box has no effect!")
+
+
+cdef _warn_if_z_in_2d_box(cpp_bool is2D, Lz):
+    """Warn that setting a nonzero Lz has no effect on a 2D box."""
+    if is2D and Lz != 0:
+        warnings.warn(_Z_IN_2D_BOX_MESSAGE)
+
+
+@cython.cdivision(True)
+cdef void _box_params_from_matrix(const float[:, :] m,
+                                  double* params) noexcept nogil:
+    r"""Compute :code:`(Lx, Ly, Lz, xy, xz, yz)` from a 3x3 box matrix.
+
+    The box matrix is tiny, so the vector algebra is written out in scalar
+    form to avoid the overhead of many small NumPy calls.
+
+    .. warning:: This function cannot raise and reads fixed indices without
+                 bounds checking, so callers must guarantee that ``m`` has
+                 shape :math:`\left(3, 3\right)` (e.g. with
+                 :func:`freud.util._convert_array`).
+    """
+    cdef double m00 = m[0, 0], m01 = m[0, 1], m02 = m[0, 2]
+    cdef double m10 = m[1, 0], m11 = m[1, 1], m12 = m[1, 2]
+    cdef double m20 = m[2, 0], m21 = m[2, 1], m22 = m[2, 2]
+    cdef double Lx, Ly, Lz, xy, xz, yz, a2x, a3x
+    cdef double cx, cy, cz, v0xv1mag
+
+    Lx = sqrt(m00 * m00 + m10 * m10 + m20 * m20)
+    a2x = (m00 * m01 + m10 * m11 + m20 * m21) / Lx
+    Ly = sqrt(m01 * m01 + m11 * m11 + m21 * m21 - a2x * a2x)
+    xy = a2x / Ly
+    cx = m10 * m21 - m20 * m11
+    cy = m20 * m01 - m00 * m21
+    cz = m00 * m11 - m10 * m01
+    v0xv1mag = sqrt(cx * cx + cy * cy + cz * cz)
+    Lz = (m02 * cx + m12 * cy + m22 * cz) / v0xv1mag
+    if Lz != 0:
+        a3x = (m00 * m02 + m10 * m12 + m20 * m22) / Lx
+        xz = a3x / Lz
+        yz = (m01 * m02 + m11 * m12 + m21 * m22 - a2x * a3x) / (Ly * Lz)
+    else:
+        xz = yz = 0
+
+    params[0] = Lx
+    params[1] = Ly
+    params[2] = Lz
+    params[3] = xy
+    params[4] = xz
+    params[5] = yz
+
+
 cdef class Box:
     r"""The freud Box class for simulation boxes.
 
@@ -67,9 +124,7 @@ cdef class Box:
             if not (Lx and Ly):
                 raise ValueError("Lx and Ly must be nonzero for 2D boxes.")
             elif Lz != 0 or xz != 0 or yz != 0:
-                warnings.warn(
-                    "Specifying z-dimensions in a 2-dimensional box "
-                    "has no effect!")
+                warnings.warn(_Z_IN_2D_BOX_MESSAGE)
         else:
             if not (Lx and Ly and Lz):
                 raise ValueError(
@@ -96,10 +151,7 @@ cdef class Box:
             # Will fail if object has no length
             value = (value, value, value)
 
-        if self.is2D and value[2] != 0:
-            warnings.warn(
-                "Specifying z-dimensions in a 2-dimensional box "
-                "has no effect!")
+        _warn_if_z_in_2d_box(self.thisptr.is2D(), value[2])
         self.thisptr.setL(value[0], value[1], value[2])
 
     @property
@@ -109,7 +161,7 @@ cdef class Box:
 
     @Lx.setter
     def Lx(self, value):
-        self.L = [value, self.Ly, self.Lz]
+        self.thisptr.setLx(value)
 
     @property
     def Ly(self):
@@ -118,7 +170,7 @@ cdef class Box:
 
     @Ly.setter
     def Ly(self, value):
-        self.L = [self.Lx, value, self.Lz]
+        self.thisptr.setLy(value)
 
     @property
     def Lz(self):
@@ -127,7 +179,8 @@ cdef class Box:
 
     @Lz.setter
     def Lz(self, value):
-        self.L = [self.Lx, self.Ly, value]
+        _warn_if_z_in_2d_box(self.thisptr.is2D(), value)
+        self.thisptr.setLz(value)
 
     @property
     def xy(self):
@@ -595,15 +648,16 @@ cdef class Box:
     @property
     def cubic(self):
         """bool: Whether the box is a cube."""
+        Lx, Ly, Lz, xy, xz, yz, dimensions = self._params()
         return (
-            not self.is2D
+            dimensions == 3
             and np.allclose(
-                [self.Lx, self.Lx, self.Ly, self.Ly, self.Lz, self.Lz],
-                [self.Ly, self.Lz, self.Lx, self.Lz, self.Lx, self.Ly],
+                [Lx, Lx, Ly, Ly, Lz, Lz],
+                [Ly, Lz, Lx, Lz, Lx, Ly],
                 rtol=1e-5,
                 atol=1e-5,
             )
-            and np.allclose(0, [self.xy, self.yz, self.xz], rtol=1e-5, atol=1e-5)
+            and np.allclose(0, [xy, yz, xz], rtol=1e-5, atol=1e-5)
         )
 
     @property
@@ -663,13 +717,25 @@ cdef class Box:
           dict: Box parameters
         """
         return {
-            'Lx': self.Lx,
-            'Ly': self.Ly,
-            'Lz': self.Lz,
-            'xy': self.xy,
-            'xz': self.xz,
-            'yz': self.yz,
-            'dimensions': self.dimensions}
+            'Lx': self.thisptr.getLx(),
+            'Ly': self.thisptr.getLy(),
+            'Lz': self.thisptr.getLz(),
+            'xy': self.thisptr.getTiltFactorXY(),
+            'xz': self.thisptr.getTiltFactorXZ(),
+            'yz': self.thisptr.getTiltFactorYZ(),
+            'dimensions': 2 if self.thisptr.is2D() else 3}
+
+    def _params(self):
+        r"""Return all box parameters in a single call.
+
+        Returns:
+            tuple: :code:`(Lx, Ly, Lz, xy, xz, yz, dimensions)`.
+        """
+        return (self.thisptr.getLx(), self.thisptr.getLy(),
+                self.thisptr.getLz(), self.thisptr.getTiltFactorXY(),
+                self.thisptr.getTiltFactorXZ(),
+                self.thisptr.getTiltFactorYZ(),
+                2 if self.thisptr.is2D() else 3)
 
     def to_matrix(self):
         r"""Returns the box matrix (3x3).
@@ -685,9 +751,15 @@ cdef class Box:
         Returns:
             :math:`\left(3, 3\right)` :class:`numpy.ndarray`: Box matrix
         """
-        return np.asarray([[self.Lx, self.xy * self.Ly, self.xz * self.Lz],
-                           [0, self.Ly, self.yz * self.Lz],
-                           [0, 0, self.Lz]])
+        Lx, Ly, Lz, xy, xz, yz, _ = self._params()
+        matrix = np.zeros((3, 3))
+        matrix[0, 0] = Lx
+        matrix[0, 1] = xy * Ly
+        matrix[0, 2] = xz * Lz
+        matrix[1, 1] = Ly
+        matrix[1, 2] = yz * Lz
+        matrix[2, 2] = Lz
+        return matrix
 
     def to_box_lengths_and_angles(self):
         r"""Return the box lengths and angles.
@@ -697,15 +769,16 @@ cdef class Box:
                 The box vector lengths and angles in radians
                 :math:`(L_1, L_2, L_3, \alpha, \beta, \gamma)`.
         """
+        Lx, Ly, Lz, xy, xz, yz, _ = self._params()
         alpha = np.arccos(
-            (self.xy * self.xz + self.yz)
-            / (np.sqrt(1 + self.xy**2) * np.sqrt(1 + self.xz**2 + self.yz**2))
+            (xy * xz + yz)
+            / (np.sqrt(1 + xy**2) * np.sqrt(1 + xz**2 + yz**2))
         )
-        beta = np.arccos(self.xz/np.sqrt(1+self.xz**2+self.yz**2))
-        gamma = np.arccos(self.xy/np.sqrt(1+self.xy**2))
-        L1 = self.Lx
-        a2 = [self.Ly*self.xy, self.Ly, 0]
-        a3 = [self.Lz*self.xz, self.Lz*self.yz, self.Lz]
+        beta = np.arccos(xz/np.sqrt(1+xz**2+yz**2))
+        gamma = np.arccos(xy/np.sqrt(1+xy**2))
+        L1 = Lx
+        a2 = [Ly*xy, Ly, 0]
+        a3 = [Lz*xz, Lz*yz, Lz]
         L2 = np.linalg.norm(a2)
         L3 = np.linalg.norm(a3)
         return (L1, L2, L3, alpha, beta, gamma)
@@ -741,11 +814,12 @@ cdef class Box:
 
     def __mul__(self, scale):
         if scale > 0:
-            return self.__class__(Lx=self.Lx*scale,
-                                  Ly=self.Ly*scale,
-                                  Lz=self.Lz*scale,
-                                  xy=self.xy, xz=self.xz, yz=self.yz,
-                                  is2D=self.is2D)
+            Lx, Ly, Lz, xy, xz, yz, dimensions = self._params()
+            return self.__class__(Lx=Lx*scale,
+                                  Ly=Ly*scale,
+                                  Lz=Lz*scale,
+                                  xy=xy, xz=xz, yz=yz,
+                                  is2D=(dimensions == 2))
         else:
             raise ValueError("Box can only be multiplied by positive values.")
 
@@ -812,55 +886,20 @@ cdef class Box:
         Returns:
             :class:`freud.box.Box`: The resulting box object.
         """
-        if np.asarray(box).shape == (3, 3):
-            # Handles 3x3 matrices
-            return cls.from_matrix(box, dimensions=dimensions)
         try:
-            # Handles freud.box.Box and objects with attributes
-            Lx = box.Lx
-            Ly = box.Ly
-            Lz = getattr(box, 'Lz', 0)
-            xy = getattr(box, 'xy', 0)
-            xz = getattr(box, 'xz', 0)
-            yz = getattr(box, 'yz', 0)
-            if dimensions is None:
-                dimensions = getattr(box, 'dimensions', None)
-            elif dimensions != getattr(box, 'dimensions', dimensions):
-                raise ValueError(
-                    "The provided dimensions argument conflicts with the "
-                    "dimensions attribute of the provided box object.")
-        except AttributeError:
-            try:
-                # Handle dictionary-like
-                Lx = box['Lx']
-                Ly = box['Ly']
-                Lz = box.get('Lz', 0)
-                xy = box.get('xy', 0)
-                xz = box.get('xz', 0)
-                yz = box.get('yz', 0)
-                if dimensions is None:
-                    dimensions = box.get('dimensions', None)
-                else:
-                    if dimensions != box.get('dimensions', dimensions):
-                        raise ValueError(
-                            "The provided dimensions argument conflicts with "
-                            "the dimensions attribute of the provided box "
-                            "object.")
-            except (IndexError, KeyError, TypeError):
-                if not len(box) in [2, 3, 6]:
-                    raise ValueError(
-                        "List-like objects must have length 2, 3, or 6 to be "
-                        "converted to freud.box.Box.")
-                # Handle list-like
-                Lx = box[0]
-                Ly = box[1]
-                Lz = box[2] if len(box) > 2 else 0
-                xy, xz, yz = box[3:6] if len(box) == 6 else (0, 0, 0)
+            Lx, Ly, Lz, xy, xz, yz, box_dimensions = _box_params(box)
         except:  # noqa
             logger.debug('Supplied box cannot be converted to type '
                          'freud.box.Box.')
             raise
 
+        if dimensions is None:
+            dimensions = box_dimensions
+        elif box_dimensions is not None and dimensions != box_dimensions:
+            raise ValueError(
+                "The provided dimensions argument conflicts with the "
+                "dimensions attribute of the provided box object.")
+
         # Infer dimensions if not provided.
         if dimensions is None:
             dimensions = 2 if Lz == 0 else 3
@@ -884,29 +923,53 @@ cdef class Box:
         Returns:
             :class:`freud.box.Box`: The resulting box object.
         """
-        box_matrix = np.asarray(box_matrix, dtype=np.float32)
-        v0 = box_matrix[:, 0]
-        v1 = box_matrix[:, 1]
-        v2 = box_matrix[:, 2]
-        Lx = np.sqrt(np.dot(v0, v0))
-        a2x = np.dot(v0, v1) / Lx
-        Ly = np.sqrt(np.dot(v1, v1) - a2x * a2x)
-        xy = a2x / Ly
-        v0xv1 = np.cross(v0, v1)
-        v0xv1mag = np.sqrt(np.dot(v0xv1, v0xv1))
-        Lz = np.dot(v2, v0xv1) / v0xv1mag
-        if Lz != 0:
-            a3x = np.dot(v0, v2) / Lx
-            xz = a3x / Lz
-            yz = (np.dot(v1, v2) - a2x * a3x) / (Ly * Lz)
-        else:
-            xz = yz = 0
+        Lx, Ly, Lz, xy, xz, yz, _ = _matrix_box_params(box_matrix)
         if dimensions is None:
             dimensions = 2 if Lz == 0 else 3
         is2D = (dimensions == 2)
         return cls(Lx=Lx, Ly=Ly, Lz=Lz,
                    xy=xy, xz=xz, yz=yz, is2D=is2D)
 
+    @classmethod
+    def from_matrix_batch(cls, box_matrices, dimensions=None):
+        r"""Initialize Box instances from an array of box matrices.
+
+        This is equivalent to calling :meth:`~.from_matrix` on each matrix,
+        but converts all matrices to box parameters in a single compiled
+        loop, which is useful for trajectories with many frames.
+
+        Args:
+            box_matrices (:math:`\left(N, 3, 3\right)` :class:`numpy.ndarray`):
+                Box matrices to convert.
+            dimensions (int):
+                Number of dimensions of every box. If :code:`None`, each box
+                is 2D if its :math:`L_z` is 0 and 3D otherwise (Default value
+                = :code:`None`).
+
+        Returns:
+            list[:class:`freud.box.Box`]: The resulting box objects.
+        """  # noqa: E501
+        # The shape check is required by _box_params_from_matrix.
+        box_matrices = freud.util._convert_array(
+            box_matrices, shape=(None, 3, 3))
+
+        cdef:
+            const float[:, :, ::1] l_box_matrices = box_matrices
+            size_t num_boxes = l_box_matrices.shape[0]
+            double[:, ::1] l_params = np.empty((num_boxes, 6))
+            size_t i
+
+        with nogil:
+            for i in range(num_boxes):
+                _box_params_from_matrix(l_box_matrices[i], &l_params[i, 0])
+
+        boxes = []
+        for Lx, Ly, Lz, xy, xz, yz in np.asarray(l_params).tolist():
+            is2D = (Lz == 0) if dimensions is None else (dimensions == 2)
+            boxes.append(cls(Lx=Lx, Ly=Ly, Lz=Lz,
+                             xy=xy, xz=xz, yz=yz, is2D=is2D))
+        return boxes
+
     @classmethod
     def cube(cls, L=None):
         r"""Construct a cubic box with equal lengths.
@@ -992,6 +1055,80 @@ cdef class Box:
         return cls.from_matrix(np.array([a1, a2, a3]).T, dimensions=dimensions)
 
 
+# Box-like objects are converted by dispatching on their type, which avoids
+# probing the object with exceptions in Box.from_box. Each converter returns
+# (Lx, Ly, Lz, xy, xz, yz, dimensions), where dimensions may be None if the
+# object does not specify it.
+@singledispatch
+def _box_params(box):
+    """Get box parameters from an object with box attributes, a
+    dictionary-like object that is not a Mapping, or a list."""
+    if hasattr(box, 'Lx'):
+        return _attribute_box_params(box)
+    if hasattr(box, 'get') and hasattr(box, '__getitem__'):
+        return _mapping_box_params(box)
+    return _sequence_box_params(box)
+
+
+def _attribute_box_params(box):
+    """Get box parameters from an object with box attributes."""
+    return (box.Lx, box.Ly, getattr(box, 'Lz', 0), getattr(box, 'xy', 0),
+            getattr(box, 'xz', 0), getattr(box, 'yz', 0),
+            getattr(box, 'dimensions', None))
+
+
+def _sequence_box_params(box):
+    """Get box parameters from a list-like object or a 3x3 matrix."""
+    if np.asarray(box).shape == (3, 3):
+        return _matrix_box_params(box)
+    if not len(box) in [2, 3, 6]:
+        raise ValueError(
+            "List-like objects must have length 2, 3, or 6 to be "
+            "converted to freud.box.Box.")
+    Lz = box[2] if len(box) > 2 else 0
+    xy, xz, yz = box[3:6] if len(box) == 6 else (0, 0, 0)
+    return (box[0], box[1], Lz, xy, xz, yz, None)
+
+
+def _matrix_box_params(box_matrix):
+    """Get box parameters from a 3x3 box matrix."""
+    # The shape check is required by _box_params_from_matrix.
+    box_matrix = freud.util._convert_array(box_matrix, shape=(3, 3))
+    cdef const float[:, ::1] l_box_matrix = box_matrix
+    cdef double params[6]
+    _box_params_from_matrix(l_box_matrix, params)
+    return (params[0], params[1], params[2],
+            params[3], params[4], params[5], None)
+
+
+@_box_params.register(Box)
+def _freud_box_params(Box box):
+    """Get box parameters from a freud.box.Box."""
+    return box._params()
+
+
+@_box_params.register(Mapping)
+def _mapping_box_params(box):
+    """Get box parameters from a dictionary-like object."""
+    return (box['Lx'], box['Ly'], box.get('Lz', 0), box.get('xy', 0),
+            box.get('xz', 0), box.get('yz', 0), box.get('dimensions', None))
+
+
+_box_params.register(list, _sequence_box_params)
+_box_params.register(np.ndarray, _sequence_box_params)
+
+
+@_box_params.register(tuple)
+def _tuple_box_params(box):
+    """Get box parameters from a tuple.
+
+    Named tuples with box attributes are read by attribute.
+    """
+    if hasattr(box, 'Lx'):
+        return _attribute_box_params(box)
+    return _sequence_box_params(box)
+
+
 cdef BoxFromCPP(const freud._box.Box & cppbox):
     b = Box(cppbox.getLx(), cppbox.getLy(), cppbox.getLz(),
             cppbox.getTiltFactorXY(), cppbox.getTiltFactorXZ(),
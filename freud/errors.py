@@ -6,7 +6,7 @@
 # Errors and exceptions internal to freud
 
 
-class FreudDeprecationWarning(UserWarning):
+class FreudDeprecationWarning(DeprecationWarning):
     """Raised when a freud feature is pending deprecation."""
 
     pass
@@ -1,11 +1,13 @@
 # Copyright (c) 2010-2023 The Regents of the University of Michigan
 # This file is from the freud project, released under the BSD 3-Clause License.
 
-import freud
-
 
 def nlist_lifetime_check(get_nlist_func):
     """Ensure nlist exists past the lifetime of the compute that created it."""
+    # Imported here so that loading this conftest does not import freud for
+    # test modules that do not use it.
+    import freud
+
     L = 10
     N = 100
     sys = freud.data.make_random_system(L, N)
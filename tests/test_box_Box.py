@@ -51,6 +51,14 @@ class TestBox:
         npt.assert_allclose(box.Lx, 4, rtol=1e-6)
         npt.assert_allclose(box.Ly, 5, rtol=1e-6)
         npt.assert_allclose(box.Lz, 6, rtol=1e-6)
+        npt.assert_allclose(box.L_inv, [1 / 4, 1 / 5, 1 / 6], rtol=1e-6)
+
+        box2d = freud.box.Box.square(2)
+        box2d.Lx = 3
+        npt.assert_allclose(box2d.L, [3, 2, 0], rtol=1e-6)
+        with pytest.warns(UserWarning):
+            box2d.Lz = 1
+        npt.assert_allclose(box2d.Lz, 0)
 
         box.L = [7, 8, 9]
         npt.assert_allclose(box.L, [7, 8, 9], rtol=1e-6)
@@ -464,6 +472,21 @@ class TestBox:
             box_dict["dimensions"] = 3
             freud.box.Box.from_box(box_dict, 2)
 
+        class DictLike:
+            """Dictionary-like object that is not a Mapping."""
+
+            def __init__(self, data):
+                self._data = data
+
+            def __getitem__(self, key):
+                return self._data[key]
+
+            def get(self, key, default=None):
+                return self._data.get(key, default)
+
+        box_dict_like = freud.box.Box.from_box(DictLike(box_dict))
+        assert box == box_dict_like
+
         BoxTuple = namedtuple(
             "BoxTuple", ["Lx", "Ly", "Lz", "xy", "xz", "yz", "dimensions"]
         )
@@ -540,6 +563,29 @@ class TestBox:
         box4 = freud.box.Box.from_matrix(box3.to_matrix())
         assert np.isclose(box3.to_matrix(), box4.to_matrix()).all()
 
+    def test_matrix_wrong_shape(self):
+        with pytest.raises(ValueError):
+            freud.box.Box.from_matrix(np.eye(2))
+        with pytest.raises(ValueError):
+            freud.box.Box.from_matrix(np.zeros((3, 4)))
+
+    def test_matrix_batch(self):
+        boxes = [
+            freud.box.Box(2, 2, 2, 1, 0.5, 0.1),
+            freud.box.Box(2, 2, 0, 0.5, 0, 0),
+            freud.box.Box(1, 2, 3),
+        ]
+        matrices = np.array([box.to_matrix() for box in boxes])
+        batch = freud.box.Box.from_matrix_batch(matrices)
+        assert len(batch) == len(boxes)
+        for box, matrix, batch_box in zip(boxes, matrices, batch):
+            assert batch_box.dimensions == box.dimensions
+            assert np.isclose(matrix, batch_box.to_matrix()).all()
+            assert batch_box == freud.box.Box.from_matrix(matrix)
+
+        with pytest.raises(ValueError):
+            freud.box.Box.from_matrix_batch(matrices[0])
+
     def test_set_dimensions(self):
         b = np.asarray([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
         with pytest.warns(UserWarning):
@@ -52,19 +52,30 @@ class TestNematicOrder:
         npt.assert_equal(op_perp.director, u)
         npt.assert_equal(op_perp.nematic_tensor, np.diag([-0.5, 1, -0.5]))
 
-    def test_imperfect(self):
+    @pytest.fixture(scope="session")
+    def noisy_orientations(self):
+        """Orientations with some noise around the x and y axes.
+
+        The arrays are shared between tests, so they are made read-only.
+        """
+        N = 10000
+        np.random.seed(0)
+        orientations = []
+        for u in ([1, 0, 0], [0, 1, 0]):
+            noisy = np.random.normal(
+                np.repeat(np.expand_dims(u, axis=0), repeats=N, axis=0), 0.1
+            )
+            noisy.flags.writeable = False
+            orientations.append(noisy)
+        return tuple(orientations)
+
+    def test_imperfect(self, noisy_orientations):
         """Test imperfectly aligned systems.
         We add some noise to the perfect system and see if the output is close
         to the ideal case.
         """
-        N = 10000
-        np.random.seed(0)
         u = [1, 0, 0]
-
-        # Generate orientations close to the u
-        orientations = np.random.normal(
-            np.repeat(np.expand_dims(u, axis=0), repeats=N, axis=0), 0.1
-        )
+        orientations = noisy_orientations[0]
 
         op = freud.order.Nematic()
         op.compute(orientations)
@@ -79,9 +90,7 @@ class TestNematicOrder:
         assert not np.all(op.nematic_tensor == np.diag([1, -0.5, -0.5]))
 
         u = np.array([0, 1, 0])
-        orientations = np.random.normal(
-            np.repeat(np.expand_dims(u, axis=0), repeats=N, axis=0), 0.1
-        )
+        orientations = noisy_orientations[1]
         op_perp = freud.order.Nematic()
         op_perp.compute(orientations)
 
@@ -94,16 +103,9 @@ class TestNematicOrder:
         npt.assert_allclose(op_perp.nematic_tensor, np.diag([-0.5, 1, -0.5]), atol=1e-1)
         assert not np.all(op_perp.nematic_tensor == np.diag([-0.5, 1, -0.5]))
 
-    def test_warning(self):
+    def test_warning(self, noisy_orientations):
         """Test that supplying a zero orientation vector raises a warning."""
-        N = 10000
-        np.random.seed(0)
-        u = [1, 0, 0]
-
-        # Generate orientations close to the u
-        orientations = np.random.normal(
-            np.repeat(np.expand_dims(u, axis=0), repeats=N, axis=0), 0.1
-        )
+        orientations = noisy_orientations[0].copy()
 
         # Change first orientation to zero vector
         orientations[0] = np.array([0, 0, 0])